@@ -6,14 +6,48 @@
 
 import os
 import sys
+import argparse
 import datetime
 import re
+import shutil
+import signal
+import stat
 import subprocess
-import tkinter as tk
-from tkinter import filedialog, messagebox
+
+# --- Precompiled regex patterns ---
+_PRODVER_RE = re.compile(r'^\d+\.\d+\.\d+\.\d+$') # Product Version: X.X.X.X
+_APPVER_RE = re.compile(r'^\d+\.\d+\.\d+$') # App Version: X.X.X
+_NON_ALNUM = re.compile(r'[\W_]+') # Anything that isn't a letter or digit (for registry key names)
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}') # {name} placeholders in NSI_TEMPLATE
+_BAD_LANG_CHAR = re.compile(r'[\s\d]') # Whitespace or digits, unusual in NSIS language names
 
 # --- Helper Functions for User Input ---
 
+def exit_cancelled(signum=None, frame=None):
+    """SIGINT handler: exits cleanly when the user presses Ctrl+C."""
+    print("\nOperation cancelled by user.")
+    print("\nBye!")
+    sys.exit(1)
+
+
+def _prompt(prompt_text):
+    """Writes the prompt and reads one line from stdin, exiting if the input ends."""
+    try:
+        if sys.stdin.isatty():
+            return input(prompt_text) # Keep readline line editing for interactive use
+        # Piped/scripted input: skip input()'s extra flushing and read the line directly
+        sys.stdout.write(prompt_text)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip('\n')
+    except EOFError:
+        print("\nInput aborted.")
+        print("\nBye!")
+        sys.exit(1)
+
+
 def ask_string(prompt, default=None, allow_empty=False): # <--- Make sure allow_empty=False is HERE
     """Asks the user for a string input, providing an optional default."""
     prompt_text = f"{prompt}"
@@ -22,24 +56,15 @@ def ask_string(prompt, default=None, allow_empty=False): # <--- Make sure allow_
     prompt_text += ": "
 
     while True:
-        try:
-            user_input = input(prompt_text).strip()
-            if user_input: # If user typed something, return it
-                return user_input
-            elif default is not None: # If user pressed Enter AND there is a default, return default
-                return default
-            elif allow_empty: # If user pressed Enter, there is NO default, BUT empty is allowed
-                return "" # Return the empty string
-            else: # If user pressed Enter, there is NO default, and empty is NOT allowed
-                print("Input cannot be empty.")
-        except EOFError:
-            print("\nInput aborted.")
-            print("\nBye!")
-            sys.exit(1)
-        except KeyboardInterrupt:
-             print("\nOperation cancelled by user.")
-             print("\nBye!")
-             sys.exit(1)
+        user_input = _prompt(prompt_text).strip()
+        if user_input: # If user typed something, return it
+            return user_input
+        elif default is not None: # If user pressed Enter AND there is a default, return default
+            return default
+        elif allow_empty: # If user pressed Enter, there is NO default, BUT empty is allowed
+            return "" # Return the empty string
+        else: # If user pressed Enter, there is NO default, and empty is NOT allowed
+            print("Input cannot be empty.")
 
 
 def ask_path(prompt, default=None, check_exists=None, is_dir=False, allow_empty=False):
@@ -55,55 +80,48 @@ def ask_path(prompt, default=None, check_exists=None, is_dir=False, allow_empty=
     prompt_text += ": "
 
     while True:
-        try:
-            user_input = input(prompt_text).strip()
-            path = user_input if user_input else default
+        user_input = _prompt(prompt_text).strip()
+        path = user_input if user_input else default
 
-            if not path:
-                if allow_empty:
-                    return ""
-                else:
-                    print("Path cannot be empty.")
-                    continue
+        if not path:
+            if allow_empty:
+                return ""
+            else:
+                print("Path cannot be empty.")
+                continue
 
-            # Normalize path for consistency
+        # Normalize path for consistency
+        try:
+            path = os.path.normpath(path)
+        except ValueError:
+            print(f"Invalid characters in path: {path}")
+            continue # Ask again if path normalization fails
+
+        if check_exists:
+            # A single stat() gives both existence and type
             try:
-                path = os.path.normpath(path)
-            except ValueError:
-                print(f"Invalid characters in path: {path}")
-                continue # Ask again if path normalization fails
-
-            if check_exists:
-                exists = os.path.exists(path)
-                is_correct_type = True
-                if exists and is_dir:
-                    is_correct_type = os.path.isdir(path)
-                elif exists and not is_dir:
-                     is_correct_type = os.path.isfile(path)
-
-                if not exists:
-                    if check_exists == 'require':
-                        print(f"Error: Required path not found: {path}")
-                        continue # Ask again
-                    elif check_exists == 'warn':
-                        print(f"Warning: Path not found: {path}")
-                elif not is_correct_type:
-                     type_str = "directory" if is_dir else "file"
-                     if check_exists == 'require':
-                          print(f"Error: Path exists but is not a {type_str}: {path}")
-                          continue
-                     elif check_exists == 'warn':
-                         print(f"Warning: Path exists but is not a {type_str}: {path}")
-
-            return path # Path is valid or warning was ignored
-        except EOFError:
-             print("\nInput aborted.")
-             print("\nBye!")
-             sys.exit(1)
-        except KeyboardInterrupt:
-            print("\nOperation cancelled by user.")
-            print("\nBye!")
-            sys.exit(1)
+                st = os.stat(path)
+                exists = True
+                is_correct_type = stat.S_ISDIR(st.st_mode) if is_dir else stat.S_ISREG(st.st_mode)
+            except (OSError, ValueError): # Same cases os.path.exists() treats as "not found"
+                exists = False
+                is_correct_type = False
+
+            if not exists:
+                if check_exists == 'require':
+                    print(f"Error: Required path not found: {path}")
+                    continue # Ask again
+                elif check_exists == 'warn':
+                    print(f"Warning: Path not found: {path}")
+            elif not is_correct_type:
+                 type_str = "directory" if is_dir else "file"
+                 if check_exists == 'require':
+                      print(f"Error: Path exists but is not a {type_str}: {path}")
+                      continue
+                 elif check_exists == 'warn':
+                     print(f"Warning: Path exists but is not a {type_str}: {path}")
+
+        return path # Path is valid or warning was ignored
 
 
 def ask_bool(prompt, default=True):
@@ -112,30 +130,21 @@ def ask_bool(prompt, default=True):
     prompt_text = f"{prompt} {options}: "
 
     while True:
-        try:
-            user_input = input(prompt_text).strip().lower()
-            if not user_input:
-                return default
-            if user_input in ['y', 'yes']:
-                return True
-            if user_input in ['n', 'no']:
-                return False
-            print("Please answer 'yes' or 'no' (or press Enter for default).")
-        except EOFError:
-             print("\nInput aborted.")
-             print("\nBye!")
-             sys.exit(1)
-        except KeyboardInterrupt:
-            print("\nOperation cancelled by user.")
-            print("\nBye!")
-            sys.exit(1)
+        user_input = _prompt(prompt_text).strip().lower()
+        if not user_input:
+            return default
+        if user_input in ['y', 'yes']:
+            return True
+        if user_input in ['n', 'no']:
+            return False
+        print("Please answer 'yes' or 'no' (or press Enter for default).")
 
 
 def ask_choice(prompt, options, default=None):
     """Asks the user to choose from a list of options."""
-    print(prompt)
-    for i, option in enumerate(options):
-        print(f"  {i+1}) {option}")
+    # Write the whole numbered menu in one go
+    menu_lines = [prompt] + [f"  {i+1}) {option}" for i, option in enumerate(options)]
+    sys.stdout.write("\n".join(menu_lines) + "\n")
 
     default_index = -1
     if default in options:
@@ -146,7 +155,7 @@ def ask_choice(prompt, options, default=None):
 
     while True:
         try:
-            user_input = input(prompt_text).strip()
+            user_input = _prompt(prompt_text).strip()
             if not user_input and default_index != -1:
                 return options[default_index]
             if not user_input:
@@ -163,14 +172,6 @@ def ask_choice(prompt, options, default=None):
                 print(f"Invalid choice. Please enter a number between 1 and {len(options)}.")
         except ValueError:
             print("Invalid input. Please enter a number.")
-        except EOFError:
-             print("\nInput aborted.")
-             print("\nBye!")
-             sys.exit(1)
-        except KeyboardInterrupt:
-            print("\nOperation cancelled by user.")
-            print("\nBye!")
-            sys.exit(1)
 
 
 def validate_product_version(prompt, app_version, default=None, allow_empty=False):
@@ -182,45 +183,58 @@ def validate_product_version(prompt, app_version, default=None, allow_empty=Fals
     prompt_text += ": "
 
     while True:
+        user_input = _prompt(prompt_text).strip()
+        # Validate first, before checking other conditions
+        if user_input and not _PRODVER_RE.match(user_input):
+            print("Error: Product Version must be in the format 'X.X.X.X' (four numbers separated by dots).")
+            # Suggest a corrected version based on app_version if available
+            if app_version and _APPVER_RE.match(app_version):
+                 suggested_version = f"{app_version}.0"
+                 print(f"Suggestion based on App Version: {suggested_version}")
+                 # Optionally, you could ask if they want to use the suggestion or re-enter
+            continue # Ask again after showing the error
+
+        # Now handle the input/default/empty logic
+        if user_input: # If user typed something valid, return it
+            return user_input
+        elif default is not None: # If user pressed Enter AND there is a default, return default
+            # Also validate the default if it's being used
+            if not _PRODVER_RE.match(default):
+                 print(f"Warning: Default value '{default}' is not in the correct format 'X.X.X.X'.")
+                 # Decide how to handle invalid default - here we ask again
+                 print("Please enter a valid version.")
+                 continue
+            return default
+        elif allow_empty: # If user pressed Enter, there is NO default, BUT empty is allowed
+            return "" # Return the empty string
+        else: # If user pressed Enter, there is NO default, and empty is NOT allowed
+            print("Input cannot be empty.")
+             
+
+# --- Tkinter Helpers ---
+
+_tk_root = None
+
+def get_tk_root():
+    """Imports Tkinter and creates the hidden root window the first time a dialog is needed."""
+    global _tk_root
+    if _tk_root is None:
         try:
-            user_input = input(prompt_text).strip()
-            # Validate first, before checking other conditions
-            if user_input and not re.match(r'^\d+\.\d+\.\d+\.\d+$', user_input):
-                print("Error: Product Version must be in the format 'X.X.X.X' (four numbers separated by dots).")
-                # Suggest a corrected version based on app_version if available
-                if app_version and re.match(r'^\d+\.\d+\.\d+$', app_version):
-                     suggested_version = f"{app_version}.0"
-                     print(f"Suggestion based on App Version: {suggested_version}")
-                     # Optionally, you could ask if they want to use the suggestion or re-enter
-                continue # Ask again after showing the error
-
-            # Now handle the input/default/empty logic
-            if user_input: # If user typed something valid, return it
-                return user_input
-            elif default is not None: # If user pressed Enter AND there is a default, return default
-                # Also validate the default if it's being used
-                if not re.match(r'^\d+\.\d+\.\d+\.\d+$', default):
-                     print(f"Warning: Default value '{default}' is not in the correct format 'X.X.X.X'.")
-                     # Decide how to handle invalid default - here we ask again
-                     print("Please enter a valid version.")
-                     continue
-                return default
-            elif allow_empty: # If user pressed Enter, there is NO default, BUT empty is allowed
-                return "" # Return the empty string
-            else: # If user pressed Enter, there is NO default, and empty is NOT allowed
-                print("Input cannot be empty.")
-        except EOFError:
-            print("\nInput aborted.")
-            print("\nBye!")
+            import tkinter as tk
+        except ImportError:
+            print("Error: Tkinter is required for the file dialogs but is not available.", file=sys.stderr)
             sys.exit(1)
-        except KeyboardInterrupt:
-             print("\nOperation cancelled by user.")
-             print("\nBye!")
-             sys.exit(1)
-             
+        try:
+            _tk_root = tk.Tk()
+        except tk.TclError as e:
+            print(f"Error: Could not start Tkinter for the file dialogs: {e}", file=sys.stderr)
+            sys.exit(1)
+        _tk_root.withdraw() # Hide the root window, only the dialogs are shown
+    return _tk_root
+
 
 # --- NSIS Template ---
-# Uses Python's f-string formatting. Variables like {app_name} are placeholders.
+# Variables like {app_name} are placeholders, filled in by render_nsi_template().
 NSI_TEMPLATE = """
 ; NSIS script generated with NSIS Script Generator (https://github.com/Useless-Projects/NSIS-Script-Generator)
 ; © {current_year} Thibault Savenkoff
@@ -320,13 +334,36 @@ Section "Uninstall" SecUninstall
 SectionEnd
 """
 
+# Split the template once at import: even indices are literal text, odd indices are placeholder names.
+# Literal text is stored already encoded, with Windows line endings for NSIS.
+NSI_TEMPLATE_PARTS = [
+    part if i % 2 else part.replace("\n", "\r\n").encode("utf-8")
+    for i, part in enumerate(_PLACEHOLDER_RE.split(NSI_TEMPLATE))
+]
+
+
+def render_nsi_template(context):
+    """Fills the NSIS template placeholders from the context dictionary, returning UTF-8 bytes with CRLF line endings."""
+    parts = NSI_TEMPLATE_PARTS[:]
+    for i in range(1, len(parts), 2):
+        value = str(context[parts[i]]) # Raises KeyError for a missing placeholder, like str.format
+        parts[i] = value.replace("\n", "\r\n").encode("utf-8")
+    return b"".join(parts)
+
+
 def generate_nsis_script_from_config(config):
-    """Generates the NSIS script content based on the config dictionary."""
+    """Generates the NSIS script content (UTF-8 bytes, CRLF line endings) based on the config dictionary."""
     context = {}
-    context['generation_date'] = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    context['current_year'] = datetime.datetime.now().year
+    now = datetime.datetime.now()
+    context['generation_date'] = now.strftime('%Y-%m-%d %H:%M:%S')
+    context['current_year'] = now.year
     context.update(config) # Directly use the collected config
 
+    # Check optional files once, the results are reused below
+    license_exists = bool(config.get('license_file')) and os.path.exists(config['license_file'])
+    icon_exists = bool(config.get('installer_icon')) and os.path.exists(config['installer_icon'])
+    unicon_exists = bool(config.get('uninstaller_icon')) and os.path.exists(config['uninstaller_icon'])
+
     # --- Generate Language Macros ---
     lang_macros_lines = []
     if 'selected_languages' in config and config['selected_languages']:
@@ -342,9 +379,14 @@ def generate_nsis_script_from_config(config):
     context['language_macros'] = "\n".join(lang_macros_lines)
 
     # --- Process specific fields ---
-    context['install_dir_base'] = "$PROGRAMFILES64" if config.get('prefer_64bit', True) and config.get('request_admin', True) else "$PROGRAMFILES" if config.get('request_admin', False) else "$LOCALAPPDATA"
-    context['request_execution_level'] = "RequestExecutionLevel admin" if config.get('request_admin', True) else "RequestExecutionLevel user"
-    context['adminregistry'] = "HKLM" if config.get('request_admin', True) else "HKCU"
+    request_admin = bool(config.get('request_admin', True))
+    prefer_64bit = bool(config.get('prefer_64bit', True))
+    if request_admin:
+        context['install_dir_base'] = "$PROGRAMFILES64" if prefer_64bit else "$PROGRAMFILES"
+    else:
+        context['install_dir_base'] = "$LOCALAPPDATA"
+    context['request_execution_level'] = "RequestExecutionLevel admin" if request_admin else "RequestExecutionLevel user"
+    context['adminregistry'] = "HKLM" if request_admin else "HKCU"
 
     # Compression
     comp = config.get('compression', 'lzma').lower()
@@ -353,18 +395,18 @@ def generate_nsis_script_from_config(config):
 
     # MUI Defines
     mui_defines = ["!define MUI_ABORTWARNING"]
-    if config.get('license_file') and os.path.exists(config['license_file']):
+    if license_exists:
         if config['license_file'].lower().endswith(".rtf"):
             mui_defines.append(f'!define MUI_LICENSEPAGE_CHECKBOX') # Optional checkbox for RTF
     else:
         # Disable license page if file doesn't exist, even if user said yes during prompt
         config['show_license_page'] = False # Ensure consistency
 
-    if config.get('installer_icon') and os.path.exists(config['installer_icon']):
+    if icon_exists:
         mui_defines.append(f'!define MUI_ICON "{config["installer_icon"]}"')
-    if config.get('uninstaller_icon') and os.path.exists(config['uninstaller_icon']):
+    if unicon_exists:
         mui_defines.append(f'!define MUI_UNICON "{config["uninstaller_icon"]}"')
-    elif config.get('installer_icon') and os.path.exists(config['installer_icon']): # Fallback
+    elif icon_exists: # Fallback
         mui_defines.append(f'!define MUI_UNICON "{config["installer_icon"]}"')
     context['mui_defines'] = "\n".join(mui_defines)
 
@@ -384,7 +426,7 @@ def generate_nsis_script_from_config(config):
     # Shortcut Creation Code
     create_shortcut_lines = []
     remove_shortcut_lines = []
-    if config.get('request_admin', True):
+    if request_admin:
          create_shortcut_lines.append("  SetShellVarContext all ; Install for all users")
          remove_shortcut_lines.append("  SetShellVarContext all ; Remove for all users")
 
@@ -419,10 +461,10 @@ def generate_nsis_script_from_config(config):
     # Uninstall Icon Registry Entry
     uninst_icon_path_reg = None
     # Prefer specified uninstaller icon if it exists
-    if config.get('uninstaller_icon') and os.path.exists(config['uninstaller_icon']):
+    if unicon_exists:
         uninst_icon_path_reg = config['uninstaller_icon']
     # Fallback to installer icon if it exists
-    elif config.get('installer_icon') and os.path.exists(config['installer_icon']):
+    elif icon_exists:
          uninst_icon_path_reg = config['installer_icon']
 
     if uninst_icon_path_reg:
@@ -441,7 +483,7 @@ def generate_nsis_script_from_config(config):
     # --- Format the template ---
     try:
         # Ensure all placeholders are handled
-        final_script = NSI_TEMPLATE.format(**context)
+        final_script = render_nsi_template(context)
         return final_script
     except KeyError as e:
         print(f"\nError: Missing configuration key needed for template: {e}", file=sys.stderr)
@@ -452,11 +494,31 @@ def generate_nsis_script_from_config(config):
          return None
 
 
+# --- File Output ---
+
+def write_nsi_file(path, data):
+    """Writes the already encoded NSIS script to path with a low-level os.write."""
+    # O_BINARY (no newline translation) and O_SEQUENTIAL (cache hint) only exist on Windows
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_SEQUENTIAL', 0)
+    fd = os.open(path, flags, 0o666) # Permissions left to the umask, like open()
+    try:
+        view = memoryview(data)
+        while view: # os.write may write less than asked, normally this loops only once
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
 # --- Main Execution ---
 if __name__ == "__main__":
-    # Initialize Tkinter but hide the root window
-    root = tk.Tk()
-    root.withdraw()
+    # Ctrl+C anywhere (prompts, dialogs, compilation) exits with the same message
+    signal.signal(signal.SIGINT, exit_cancelled)
+
+    parser = argparse.ArgumentParser(description="Interactively generate an NSIS installer script.")
+    parser.add_argument("--output", metavar="PATH",
+                        help="save the generated .nsi script to PATH instead of asking with a Save As dialog")
+    args = parser.parse_args()
 
     print("--- NSIS Script Generator ---")
     print("Please answer the following questions to configure your installer.")
@@ -479,9 +541,14 @@ if __name__ == "__main__":
     # --- File Paths ---
     print("\n--- File Paths ---")
 
+    # Tkinter is only loaded now that the first dialog is needed
+    root = get_tk_root()
+    from tkinter import filedialog, messagebox
+
     # Use Tkinter for source directory - Directly open dialog
     print("Select the directory containing ALL files/folders to install...")
     source_dir_selected = filedialog.askdirectory(title="Select Source Directory")
+    root.update() # Flush pending Tk events before the next dialog
     if not source_dir_selected:
         print("Source directory selection cancelled. Exiting.")
         sys.exit(1)
@@ -496,6 +563,7 @@ if __name__ == "__main__":
         initialdir=config['source_dir'], # Start in the source directory
         filetypes=[("Executable files", "*.exe"), ("All files", "*.*")]
     )
+    root.update()
     if exe_selected:
         # Validate that the selected file is within the source directory
         if os.path.dirname(os.path.normpath(exe_selected)) == config['source_dir']:
@@ -517,6 +585,7 @@ if __name__ == "__main__":
         title="Select License File (Optional)",
         filetypes=[("Text files", "*.txt"), ("Rich Text Format", "*.rtf"), ("All files", "*.*")]
     )
+    root.update()
     if license_selected:
         config['license_file'] = os.path.normpath(license_selected)
         print(f"Selected License File: {config['license_file']}")
@@ -531,6 +600,7 @@ if __name__ == "__main__":
         title="Select Installer Icon (Optional)",
         filetypes=[("Icon files", "*.ico"), ("All files", "*.*")]
     )
+    root.update()
     if icon_selected:
         config['installer_icon'] = os.path.normpath(icon_selected)
         print(f"Selected Installer Icon: {config['installer_icon']}")
@@ -545,6 +615,7 @@ if __name__ == "__main__":
         title="Select Uninstaller Icon (Optional)",
         filetypes=[("Icon files", "*.ico"), ("All files", "*.*")]
     )
+    root.update()
     if unicon_selected:
         config['uninstaller_icon'] = os.path.normpath(unicon_selected)
         print(f"Selected Uninstaller Icon: {config['uninstaller_icon']}")
@@ -601,8 +672,8 @@ if __name__ == "__main__":
     # --- Registry ---
     print("\n--- Registry ---")
 
-    app_name_safe = ''.join(filter(str.isalnum, config['app_name']))
-    publisher_safe = ''.join(filter(str.isalnum, config['publisher']))
+    app_name_safe = _NON_ALNUM.sub('', config['app_name'])
+    publisher_safe = _NON_ALNUM.sub('', config['publisher'])
     default_uninstall_key = f"Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\{app_name_safe}"
     config['uninstall_reg_key'] = ask_string("Registry key for Uninstall Information (must be unique!)", default=default_uninstall_key)
 
@@ -613,6 +684,7 @@ if __name__ == "__main__":
     print("\n--- Language ---")
 
     selected_languages = []
+    selected_langs_set = set() # Fast duplicate check alongside the ordered list
     print("Enter the installer languages one by one.")
     print("These MUST match NSIS language file names (e.g., English, German, French).")
     print("See NSIS\\Contrib\\Language files directory for available names.")
@@ -621,25 +693,28 @@ if __name__ == "__main__":
         primary_lang = ask_string("Enter the primary/default language", default="English").capitalize()
         if primary_lang:
             selected_languages.append(primary_lang)
+            selected_langs_set.add(primary_lang)
+            current_langs_str = primary_lang
             break
         else:
             print("You must specify at least one language.")
 
     # Ask for additional languages
     while True:
-        current_langs_str = ', '.join(selected_languages)
         next_lang = ask_string(
             f"Add another language? Current: {current_langs_str} (Leave blank to finish)",
             allow_empty=True
         ).capitalize()
         if not next_lang:
             break # User finished adding languages
-        if next_lang not in selected_languages:
+        if next_lang not in selected_langs_set:
             # Basic check - NSIS names usually don't have spaces or numbers
-            if ' ' in next_lang or any(char.isdigit() for char in next_lang):
+            if _BAD_LANG_CHAR.search(next_lang):
                  print(f"Warning: '{next_lang}' seems like an unusual NSIS language name. Ensure it matches a .nlf file.")
             selected_languages.append(next_lang)
-            print(f"Added '{next_lang}'. Current: {', '.join(selected_languages)}")
+            selected_langs_set.add(next_lang)
+            current_langs_str += ", " + next_lang
+            print(f"Added '{next_lang}'. Current: {current_langs_str}")
         else:
             print(f"'{next_lang}' is already in the list.")
 
@@ -669,43 +744,56 @@ if __name__ == "__main__":
     if nsis_script_content:
         default_nsi_filename = f"{config['app_name'].lower().replace(' ', '_').replace('.', '')}.nsi"
 
-        # Use Tkinter Save As dialog
-        print("Select where to save the generated NSIS script...")
-        nsi_output_file = filedialog.asksaveasfilename(
-            title="Save NSIS Script As",
-            initialfile=default_nsi_filename,
-            defaultextension=".nsi",
-            filetypes=[("NSIS Script", "*.nsi"), ("All Files", "*.*")]
-        )
+        if args.output:
+            nsi_output_file = args.output # Given on the command line, no dialog needed
+        else:
+            # Use Tkinter Save As dialog
+            print("Select where to save the generated NSIS script...")
+            nsi_output_file = filedialog.asksaveasfilename(
+                title="Save NSIS Script As",
+                initialfile=default_nsi_filename,
+                defaultextension=".nsi",
+                filetypes=[("NSIS Script", "*.nsi"), ("All Files", "*.*")]
+            )
 
         if not nsi_output_file:
             print("Save operation cancelled. Exiting.")
             print("\nBye!")
             sys.exit(1)
 
+        abs_nsi = os.path.abspath(nsi_output_file)
+        nsi_dir = os.path.dirname(abs_nsi)
+
         try:
-            with open(nsi_output_file, "w", encoding="utf-8", newline='\r\n') as f: # Use Windows line endings for NSIS
-                f.write(nsis_script_content)
+            write_nsi_file(nsi_output_file, nsis_script_content)
             print(f"\nSuccessfully generated '{nsi_output_file}'")
 
             # --- Optional: Offer to compile ---
             if ask_bool("\nAttempt to compile the script now using 'makensis'?", default=True):
                 try:
-                    print(f"Running: makensis \"{os.path.abspath(nsi_output_file)}\"")
-                    # Use shell=True cautiously, might be needed for finding makensis in PATH on Windows easily
-                    process = subprocess.run(['makensis', os.path.abspath(nsi_output_file)],
-                                             capture_output=True, text=True, check=False,
-                                             shell=(sys.platform == "win32"), encoding='utf-8', errors='replace')
+                    # Resolve makensis on PATH ourselves (honours PATHEXT on Windows) so no shell is needed
+                    makensis_exe = shutil.which('makensis')
+                    if makensis_exe is None:
+                        raise FileNotFoundError('makensis')
+                    print(f"Running: makensis \"{abs_nsi}\"")
                     print("\n--- Compilation Output ---")
-                    print(process.stdout if process.stdout else "(No standard output)")
-                    if process.stderr:
-                         print("--- Compilation Errors/Warnings ---")
-                         print(process.stderr)
-
-                    if process.returncode == 0:
+                    # Stream makensis output (errors/warnings included) as it is produced
+                    process = subprocess.Popen([makensis_exe, abs_nsi],
+                                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                               text=True, encoding='utf-8', errors='replace', bufsize=1)
+                    has_output = False
+                    with process.stdout:
+                        for line in process.stdout:
+                            sys.stdout.write(line)
+                            has_output = True
+                    returncode = process.wait()
+                    if not has_output:
+                        print("(No output)")
+
+                    if returncode == 0:
                          print("--- Compilation Successful ---")
                          # Construct expected output path relative to the NSI file location
-                         output_installer_path = os.path.join(os.path.dirname(os.path.abspath(nsi_output_file)), config['output_installer_name'])
+                         output_installer_path = os.path.join(nsi_dir, config['output_installer_name'])
                          if os.path.exists(output_installer_path):
                               print(f"Installer created: {output_installer_path}")
                          else:
@@ -713,7 +801,7 @@ if __name__ == "__main__":
                               print(f"Installer '{config['output_installer_name']}' may have been created.")
                               print("Check the compilation output above or the directory containing the NSI script.")
                     else:
-                         print(f"--- Compilation Failed (exit code {process.returncode}) ---")
+                         print(f"--- Compilation Failed (exit code {returncode}) ---")
 
                 except FileNotFoundError:
                     print("\nError: 'makensis.exe' command not found.")